@@ -1,8 +1,26 @@
 from operator import is_
 import os
-import numpy as np
+import random
+from array import array
 from uuid import uuid4
-from pieces import Pawn, Rook, Bishop, Queen, King, Knight
+from pieces import (
+    Pawn,
+    Rook,
+    Bishop,
+    Queen,
+    King,
+    Knight,
+    ROOK_MASK,
+    ROOK_ATTACKS,
+    BISHOP_MASK,
+    BISHOP_ATTACKS,
+    KNIGHT_ATTACKS,
+    KING_ATTACKS,
+    PAWN_ATTACKS,
+    BETWEEN,
+    ALL_CELLS,
+    SQUARE_TO_CELL,
+)
 from util import (
     map_piece_to_character,
     InvalidColumnException,
@@ -10,6 +28,12 @@ from util import (
 )
 
 
+# Random keys for the zobrist hash, ZOBRIST_PSQ[code][sq] for a piece with the signed piece code placed on square sq.
+# Negative (black) codes index from the end of the list, so each of the 12 colored pieces gets its own row.
+_zobrist_random = random.Random(20240611)
+ZOBRIST_PSQ = [[_zobrist_random.getrandbits(64) for _ in range(64)] for _ in range(13)]
+
+
 class BoardBase:
     """
     Base Class for the Chess Board.
@@ -21,8 +45,8 @@ class BoardBase:
         """Constructor.
         Start with empty cells
         """
-        self.cells = [[None for _ in range(8)] for _ in range(8)]
         self.check_cache = {}
+        self.clear_board()
 
     def __str__(self):
         """
@@ -69,6 +93,23 @@ class BoardBase:
         """
         self.cells = [[None for _ in range(8)] for _ in range(8)]
 
+        # Occupancy bitboards, bit (row * 8 + col) is set if a piece of that color is placed on the cell
+        self.white_occ = 0
+        self.black_occ = 0
+        self.all_occ = 0
+
+        # Occupancy bitboards per piece type (both colors), indexed by PIECE_CODE
+        self.piece_occ = [0] * 7
+
+        # Zobrist hash of the current configuration, updated whenever a piece is placed or removed
+        self.zobrist = 0
+
+        # Flat board of piece codes indexed by square (row * 8 + col): +PIECE_CODE for white, -PIECE_CODE for black, 0 if empty
+        self.squares = array("b", bytes(64))
+
+        # Moves made by make() that can be taken back by unmake(), as (from square, to square, hit piece)
+        self.undo_stack = []
+
 
     def load_from_memory(self, configString):
         """
@@ -76,7 +117,7 @@ class BoardBase:
 
         :param name: Filename to use. 
         """       
-        self.cells = [[None for _ in range(8)] for _ in range(8)]
+        self.clear_board()
 
         for row, line in enumerate(configString.split("\n")):
               line = line.strip()
@@ -104,7 +145,7 @@ class BoardBase:
                 if pieceCode == "R":
                     piece = Rook(self, white)
 
-                self.set_cell(np.array([7-row, col]), piece)
+                self.set_cell((7-row, col), piece)
 
     def load_from_disk(self, fname):
         """
@@ -121,8 +162,8 @@ class BoardBase:
         """
         Calls is_king_check for board configurations not yet known. Caches the result for later look-up.
         """
-        # Calculate hash and see if current position is in the cache
-        hash = self.hash() + ("-w" if white else "-b")
+        # Take the zobrist hash and see if current position is in the cache
+        hash = (self.zobrist, white)
         if hash in self.check_cache:
             return self.check_cache[hash]
 
@@ -135,8 +176,13 @@ class BoardBase:
 
     def get_cell(self, cell):
         """
-        Retrieves the piece placed on the given cell or "None" if cell is invalid
+        Retrieves the piece placed on the given cell or "None" if cell is invalid.
+        The cell is either a (row, col) tuple or a square (row * 8 + col).
         """
+        # Squares can be looked up directly
+        if type(cell) is int:
+            return self.cells[cell >> 3][cell & 7] if 0 <= cell < 64 else None
+
         # If the cell is not valid, there cannot be a piece on it
         if not self.is_valid_cell(cell):
             return None
@@ -147,12 +193,22 @@ class BoardBase:
         # Return the piece on the cell
         return self.cells[row][col]
 
+    def own_occ(self, white):
+        """
+        Returns the occupancy bitboard of the pieces of the given color
+        """
+        return self.white_occ if white else self.black_occ
+
     def set_cell(self, cell, piece):
         """
         Places a piece on a given cell.
+        The cell is either a (row, col) tuple or a square (row * 8 + col).
         """
         # Unpack coordinates
-        row, col = cell
+        if type(cell) is int:
+            row, col = divmod(cell, 8)
+        else:
+            row, col = cell
 
         # Check if they are valid, raise an Exception if not
         if row < 0 or row >= 8:
@@ -167,49 +223,113 @@ class BoardBase:
             if piece.cell is not None:
                 self.set_cell(piece.cell, None)
 
-            # Update the pieces cell
-            piece.cell = np.array([row, col])
+        # Replace whatever is placed on the cell
+        sq = int(row) * 8 + int(col)
+        self._remove_piece(sq)
+        if piece is not None:
+            self._place_piece(sq, piece)
+
+    def _remove_piece(self, sq):
+        """
+        Takes the piece on the given square off the board, keeping the occupancy bitboards, the flat board and
+        the zobrist hash in sync with the cells. The cell attribute of the piece is left untouched.
+
+        :return: The removed piece or None if the square was empty
+        """
+        row, col = sq >> 3, sq & 7
+        piece = self.cells[row][col]
+        if piece is not None:
+            bit = 1 << sq
+            self.zobrist ^= ZOBRIST_PSQ[self.squares[sq]][sq]
+            if piece.white:
+                self.white_occ &= ~bit
+            else:
+                self.black_occ &= ~bit
+            self.all_occ = self.white_occ | self.black_occ
+            self.piece_occ[piece.PIECE_CODE] &= ~bit
+            self.squares[sq] = 0
+            self.cells[row][col] = None
+        return piece
+
+    def _place_piece(self, sq, piece):
+        """
+        Places a piece on the given (empty) square, keeping the occupancy bitboards, the flat board and
+        the zobrist hash in sync with the cells.
+        """
+        bit = 1 << sq
+        if piece.white:
+            self.white_occ |= bit
+        else:
+            self.black_occ |= bit
+        code = piece.PIECE_CODE * piece.sign
+        self.all_occ = self.white_occ | self.black_occ
+        self.piece_occ[piece.PIECE_CODE] |= bit
+        self.squares[sq] = code
+        self.zobrist ^= ZOBRIST_PSQ[code][sq]
+        self.cells[sq >> 3][sq & 7] = piece
+        piece.cell = SQUARE_TO_CELL[sq]
+        piece.sq = sq
+
+    def make(self, frm, to):
+        """
+        Moves the piece on cell frm to cell to, hitting any piece placed there.
+        Both cells are either a (row, col) tuple or a square (row * 8 + col), just like for :py:meth:`set_cell`.
+        The move is pushed onto the undo stack, so it can be taken back by :py:meth:`unmake`.
+        """
+        frm_sq = frm if type(frm) is int else frm[0] * 8 + frm[1]
+        to_sq = to if type(to) is int else to[0] * 8 + to[1]
+
+        captured = self._remove_piece(to_sq)
+        self._place_piece(to_sq, self._remove_piece(frm_sq))
+        self.undo_stack.append((frm_sq, to_sq, captured))
+
+    def unmake(self):
+        """
+        Takes back the last move made by :py:meth:`make`, restoring a hit piece as well.
+        """
+        frm_sq, to_sq, captured = self.undo_stack.pop()
 
-        # Update the cell on the board
-        self.cells[row][col] = piece
+        self._place_piece(frm_sq, self._remove_piece(to_sq))
+        if captured is not None:
+            self._place_piece(to_sq, captured)
 
     def reset(self):
         """
         Resets the board to its default (start) configuration
         """
         # Start with all empty cells
-        self.cells = [[None for _ in range(8)] for _ in range(8)]
+        self.clear_board()
 
         # Pawns
         for col in range(8):
-            self.set_cell(np.array([1, col]), Pawn(self, True))
-            self.set_cell(np.array([6, col]), Pawn(self, False))
+            self.set_cell((1, col), Pawn(self, True))
+            self.set_cell((6, col), Pawn(self, False))
 
         # Rooks
-        self.set_cell(np.array([0, 0]), Rook(self, True))
-        self.set_cell(np.array([0, 7]), Rook(self, True))
-        self.set_cell(np.array([7, 0]), Rook(self, False))
-        self.set_cell(np.array([7, 7]), Rook(self, False))
+        self.set_cell((0, 0), Rook(self, True))
+        self.set_cell((0, 7), Rook(self, True))
+        self.set_cell((7, 0), Rook(self, False))
+        self.set_cell((7, 7), Rook(self, False))
 
         # Knights
-        self.set_cell(np.array([0, 1]), Knight(self, True))
-        self.set_cell(np.array([0, 6]), Knight(self, True))
-        self.set_cell(np.array([7, 1]), Knight(self, False))
-        self.set_cell(np.array([7, 6]), Knight(self, False))
+        self.set_cell((0, 1), Knight(self, True))
+        self.set_cell((0, 6), Knight(self, True))
+        self.set_cell((7, 1), Knight(self, False))
+        self.set_cell((7, 6), Knight(self, False))
 
         # Bishops
-        self.set_cell(np.array([0, 2]), Bishop(self, True))
-        self.set_cell(np.array([0, 5]), Bishop(self, True))
-        self.set_cell(np.array([7, 2]), Bishop(self, False))
-        self.set_cell(np.array([7, 5]), Bishop(self, False))
+        self.set_cell((0, 2), Bishop(self, True))
+        self.set_cell((0, 5), Bishop(self, True))
+        self.set_cell((7, 2), Bishop(self, False))
+        self.set_cell((7, 5), Bishop(self, False))
 
         # Queen
-        self.set_cell(np.array([0, 3]), Queen(self, True))
-        self.set_cell(np.array([7, 3]), Queen(self, False))
+        self.set_cell((0, 3), Queen(self, True))
+        self.set_cell((7, 3), Queen(self, False))
 
         # King
-        self.set_cell(np.array([0, 4]), King(self, True))
-        self.set_cell(np.array([7, 4]), King(self, False))
+        self.set_cell((0, 4), King(self, True))
+        self.set_cell((7, 4), King(self, False))
 
         #self.save_to_disk()
 
@@ -227,14 +347,16 @@ class Board(BoardBase):
 
         """
         super().__init__()
+        self.pins_cache = [None, None]      # last (zobrist, result) of compute_pins_and_checks per color
 
     def iterate_cells_with_pieces(self, white):
 
-        for row in range(8):        
-            for col in range(8):    # iterate all cell
-                occupant = self.get_cell((row,col)) # get information (none,Piece)
-                if occupant is not None and occupant.white == white: # if not none and white
-                    yield self.get_cell((row, col))         # give piece (yield, pauses and search in the next run)
+        cells = self.cells
+        own = self.white_occ if white else self.black_occ
+        while own:                                  # only visit the occupied cells of the given color, lowest square first
+            sq = (own & -own).bit_length() - 1
+            yield cells[sq >> 3][sq & 7]            # give piece (yield, pauses and search in the next run)
+            own &= own - 1
 
         """
         **TODO**: Write a generator (using the yield keyword) that allows to iterate
@@ -271,18 +393,10 @@ class Board(BoardBase):
         """
 
     def is_king_check(self, white):
-        if self.find_king(white) is not None:
-            king_cell = tuple(self.find_king(white).cell)    # saves cell of the king
-
-            for opponent in self.iterate_cells_with_pieces(not white): # get opponent piece
-                possible_moves_op = opponent.get_reachable_cells()     # which cells can the opponent reach in next move
-
-                for move in possible_moves_op:      # is the king cell in the list
-
-                    if move == king_cell:  # yes = check
-                        return True
-            
-            return False                   
+        king = self.find_king(white)
+        if king is not None:
+            # check = any opponent piece can reach the king in its next move
+            return self.attackers_of(king.sq, not white, self.all_occ) != 0
 
         """
         **TODO**: Evaluate if the king of given color is currently in check.
@@ -295,6 +409,103 @@ class Board(BoardBase):
         """
     
 
+    def attackers_of(self, sq, white, occ):
+        """
+        Returns a bitboard of the pieces of the given color that attack the given square.
+
+        Looks from the square itself: every piece type it could hit if it were that piece attacks it. This serves both
+        check detection (the square of the king) and the king's mobility (the squares it wants to move to).
+
+        :param sq: The square (row * 8 + col) in question
+        :param white: True if the attacking pieces are WHITE, False otherwise
+        :param occ: Occupancy bitboard that blocks sliding pieces
+        """
+        piece_occ = self.piece_occ
+        queens = piece_occ[Queen.PIECE_CODE]
+        # pawns attacking sq stand where a pawn of the other color placed on sq would hit
+        return (self.white_occ if white else self.black_occ) & (
+            (ROOK_ATTACKS[sq][occ & ROOK_MASK[sq]] & (piece_occ[Rook.PIECE_CODE] | queens))
+            | (BISHOP_ATTACKS[sq][occ & BISHOP_MASK[sq]] & (piece_occ[Bishop.PIECE_CODE] | queens))
+            | (KNIGHT_ATTACKS[sq] & piece_occ[Knight.PIECE_CODE])
+            | (PAWN_ATTACKS[not white][sq] & piece_occ[Pawn.PIECE_CODE])
+            | (KING_ATTACKS[sq] & piece_occ[King.PIECE_CODE])
+        )
+
+    def compute_pins_and_checks(self, white):
+        """
+        Computes which moves of the given color keep its own king safe, so a move can be tested without placing the piece.
+
+        The check mask contains the cells a piece (other than the king) may move to when the king is in check: the checking
+        piece and, for sliding pieces, the cells in between. It contains all cells if there is no check and none in case of a
+        double check. pin_ray[sq] restricts a pinned piece on sq to the line between its king and the pinning piece
+        (pinning piece included) and contains all cells for pieces which are not pinned.
+
+        :param white: True to compute the masks for the WHITE king, False otherwise
+        :return: Tuple (check_mask, pin_ray) of a bitboard and a list of 64 bitboards
+        """
+        pin_ray = [ALL_CELLS] * 64
+
+        king = self.piece_occ[King.PIECE_CODE] & self.own_occ(white)
+        if not king:    # no king on the board, nothing can be checked or pinned
+            return ALL_CELLS, pin_ray
+
+        ksq = (king & -king).bit_length() - 1
+        own = self.own_occ(white)
+        enemy = self.own_occ(not white)
+        occ = self.all_occ
+        piece_occ = self.piece_occ
+        queens = piece_occ[Queen.PIECE_CODE]
+        rook_sliders = (piece_occ[Rook.PIECE_CODE] | queens) & enemy
+        bishop_sliders = (piece_occ[Bishop.PIECE_CODE] | queens) & enemy
+
+        # Look from the kings cell: every piece type it could hit if it were that piece is a piece giving check
+        rook_attacks = ROOK_ATTACKS[ksq][occ & ROOK_MASK[ksq]]
+        bishop_attacks = BISHOP_ATTACKS[ksq][occ & BISHOP_MASK[ksq]]
+        checkers = (
+            (rook_attacks & rook_sliders)
+            | (bishop_attacks & bishop_sliders)
+            | (KNIGHT_ATTACKS[ksq] & piece_occ[Knight.PIECE_CODE] & enemy)
+            | (PAWN_ATTACKS[white][ksq] & piece_occ[Pawn.PIECE_CODE] & enemy)
+            | (KING_ATTACKS[ksq] & piece_occ[King.PIECE_CODE] & enemy)
+        )
+
+        if not checkers:
+            check_mask = ALL_CELLS
+        elif checkers & (checkers - 1):     # double check, only the king can move
+            check_mask = 0
+        else:                               # capture the checking piece or block its line
+            check_mask = checkers | BETWEEN[ksq][checkers.bit_length() - 1]
+
+        # Remove the own pieces next to the king; sliders that become visible are pinning the piece in between
+        for attacks, masks, tables, sliders in (
+            (rook_attacks, ROOK_MASK, ROOK_ATTACKS, rook_sliders),
+            (bishop_attacks, BISHOP_MASK, BISHOP_ATTACKS, bishop_sliders),
+        ):
+            xray = tables[ksq][(occ & ~(attacks & own)) & masks[ksq]]
+            pinners = xray & ~attacks & sliders
+            while pinners:
+                psq = (pinners & -pinners).bit_length() - 1
+                pinners &= pinners - 1
+                pinned = BETWEEN[ksq][psq] & own
+                if pinned and not pinned & (pinned - 1):    # exactly one own piece in between
+                    pin_ray[pinned.bit_length() - 1] = BETWEEN[ksq][psq] | (1 << psq)
+
+        return check_mask, pin_ray
+
+    def compute_pins_and_checks_cached(self, white):
+        """
+        Calls compute_pins_and_checks unless the result for the current board configuration is already known.
+
+        All pieces of a color ask for the same masks, one after another, so only the last result per color is kept.
+        """
+        cached = self.pins_cache[white]
+        if cached is not None and cached[0] == self.zobrist:
+            return cached[1]
+
+        value = self.compute_pins_and_checks(white)
+        self.pins_cache[white] = (self.zobrist, value)
+        return value
+
     def evaluate(self):
         """
         **TODO**: Evaluate the current board configuration into a numerical number.
@@ -326,15 +537,10 @@ class Board(BoardBase):
             return False
 
         row, col = cell  # tupel unfold
-    
-        if row < 0 or row > 7: # is in valid row
-            return False
-        
-        elif col < 0 or col > 7: # is in valid col
-            return False
-    
-        else:
-            return True
+
+        # row and col are within 0..7 exactly if no bit above the lowest three is set in either of them
+        # (negative values have all higher bits set)
+        return not (row | col) & ~7
 
     def cell_is_valid_and_empty(self, cell):
         """
@@ -344,12 +550,12 @@ class Board(BoardBase):
         You can use the "is_valid_cell()" Method to verify the cell is valid in the first place.
         If so, use "get_cell()" to retrieve the piece placed on it and return True if there is None
         """
-        if self.is_valid_cell(cell): # is cell existing
-            if self.get_cell(cell) is None: # is cell empty (no piece on cell -> None)
-                return True
-        
-        else:
+        if cell is None:
             return False
+        row, col = cell
+        if not (row | col) & ~7:                        # is cell existing
+            return self.squares[row * 8 + col] == 0     # is cell empty (no piece code on the flat board)
+        return False
 
     def piece_can_enter_cell(self, piece, cell):
         """
@@ -366,14 +572,13 @@ class Board(BoardBase):
         If, however, there is another piece, it must be of opposing color. Check the other pieces "white" attribute and compare against
         the given piece "white" attribute.
         """
-        if self.is_valid_cell(cell): # is cell existing
-            if self.get_cell(cell) is None: # checks if cell is empty (no piece on cell -> None)
-                return True
-            elif piece.white is not self.get_cell(cell).white:  # if valid but occupied,
-                return True                                     # checks if piece is of opposing colour (piece is hittable)
-        else:
+        if cell is None:
             return False
- 
+        row, col = cell
+        if not (row | col) & ~7:                        # is cell existing
+            # the codes of opposing pieces have the opposite sign, so the product is negative for them and 0 if empty
+            return self.squares[row * 8 + col] * piece.sign <= 0
+        return False
 
     def piece_can_hit_on_cell(self, piece, cell):
         """
@@ -390,10 +595,10 @@ class Board(BoardBase):
         If, however, there is another piece, it must be of opposing color. Check the other pieces "white" attribute and compare against
         the given piece "white" attribute.
         """
-        if self.is_valid_cell(cell):  # is cell existing
-            if self.get_cell(cell) is not None: #  is something standing on the cell
-                if self.get_cell(cell).is_white() is not piece.is_white(): # is this piece a hittable opponent
-                    return True
-    
-        else:
-            return False
\ No newline at end of file
+        if cell is None:
+            return False
+        row, col = cell
+        if not (row | col) & ~7:                        # is cell existing
+            # is a hittable opponent standing on the cell (its code has the opposite sign)
+            return self.squares[row * 8 + col] * piece.sign < 0
+        return False
@@ -1,6 +1,7 @@
 import random
 from tqdm import tqdm
 from util import map_piece_to_character, cell_to_string
+from pieces import SQUARE_TO_CELL
 
 
 DEPTH = 3
@@ -96,21 +97,19 @@ def evaluate_all_possible_moves(board, minMaxArg, maximumNumberOfMoves = 10):
     color = minMaxArg.playAsWhite       # saves into a variable if piece is white, True = White, False = Black
     list_moves = []                     
     for piece in board.iterate_cells_with_pieces(color):     # iterates through every piece of given color
-        og_cell = piece.cell    # saves the original cell of own piece
-        moves = piece.get_valid_cells()
-        for move in moves:      # iterates through valid cells of own piece
-            occupant = board.get_cell(move)     # saves the cell of occupant piece
-            board.set_cell(move, piece)         # sets the own piece on iterated cell
+        og_sq = piece.sq        # saves the original square of own piece
+        moves = piece.get_valid_squares()
+        for move in moves:      # iterates through valid squares of own piece
+            board.make(og_sq, move)             # moves the own piece on iterated square, remembering a hit piece
             points = board.evaluate()
 
-            list_moves.append(Move(piece, move, points))    # adds Moves with their respective score into the list
+            list_moves.append(Move(piece, SQUARE_TO_CELL[move], points))    # adds Moves with their respective score into the list
             if color:
                 list_moves.sort(reverse=True, key=lambda x: x.score)    # if white then sort in descending order
             else:
                 list_moves.sort(reverse=False, key=lambda x: x.score)   # if black then sort in ascending order
 
-            board.set_cell(og_cell, piece)  
-            board.set_cell(move, occupant)  # restores the original board configuration
+            board.unmake()  # restores the original board configuration
 
     list_moves = list_moves[:maximumNumberOfMoves]  # slices the list to the given maximum moves (default 10)
     return list_moves
@@ -194,13 +193,9 @@ def minMax(board, minMaxArg):
     
     if minMaxArg.depth > 1:
         for move in all_evaluated_moves:    # iterates through every evaluated move (Move objects)
-            active_piece = move.piece       
-            og_cell = active_piece.cell     # saves the orignal cell of the own piece
-            occupant = board.get_cell(move.cell)    # retrieves the piece object of the occupant and saves it
-            board.set_cell(move.cell, active_piece) # sets the own piece into the iterated cell
+            board.make(move.piece.cell, move.cell)  # moves the own piece into the iterated cell, remembering a hit piece
             move.score = minMax_cached(board, minMaxArg.next()).score   # overwrites the score in the current Move object with the next minMaxArg
-            board.set_cell(og_cell, active_piece)
-            board.set_cell(move.cell, occupant) # restores the original board configuration
+            board.unmake()                          # restores the original board configuration
             
         if minMaxArg.playAsWhite:
             all_evaluated_moves.sort(reverse=True, key=lambda x: x.score) # if white then sort in descending order
@@ -262,8 +257,8 @@ def minMax_cached(board, minMaxArg):
     """
     global eval_cache, total_hits
 
-    # Calculate a unique hash code for the current board position and search depth
-    hash = str(minMaxArg.depth) + board.hash()
+    # Combine the zobrist hash of the current board position with the search depth
+    hash = (minMaxArg.depth, board.zobrist)
     if hash in eval_cache:
         total_hits += 1
         # print(f"Cache hit! Cache has {len(eval_cache.keys())} entries with {total_hits} hits so far")
@@ -1,4 +1,272 @@
-import numpy as np
+# ---------------------------------------------------------------------------
+# Precomputed attack tables for the sliding pieces
+#
+# Cells are numbered as square = row * 8 + col, a bitboard is an int with bit `square` set for every cell it contains.
+# For every square the relevant blockers (the rays without the board edge) are stored in ROOK_MASK / BISHOP_MASK.
+# ROOK_ATTACKS[sq] / BISHOP_ATTACKS[sq] map every possible blocker configuration to the attacked cells, so a sliding
+# piece finds all of its targets with a single lookup instead of walking each ray cell by cell.
+# ---------------------------------------------------------------------------
+
+ROOK_DIRS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+BISHOP_DIRS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+QUEEN_DIRS = ROOK_DIRS + BISHOP_DIRS
+
+
+def _build_rays():
+    """
+    RAYS[sq][dir_idx] lists the squares from sq towards the board edge in direction QUEEN_DIRS[dir_idx], nearest first.
+    """
+    rays = []
+    for sq in range(64):
+        row, col = divmod(sq, 8)
+        sq_rays = []
+        for dr, dc in QUEEN_DIRS:
+            ray = []
+            r, c = row + dr, col + dc
+            while 0 <= r < 8 and 0 <= c < 8:
+                ray.append(r * 8 + c)
+                r += dr
+                c += dc
+            sq_rays.append(tuple(ray))
+        rays.append(tuple(sq_rays))
+    return rays
+
+
+RAYS = _build_rays()
+
+# Indices into RAYS[sq] for the directions of the sliding pieces
+ROOK_RAYS = (0, 1, 2, 3)
+BISHOP_RAYS = (4, 5, 6, 7)
+
+
+def _slide_attacks(sq, occ, dir_idxs):
+    """
+    Walks all rays starting from the given square until the board edge or a blocker (which is included) is reached.
+    Only used to build the attack tables.
+    """
+    attacks = 0
+    rays = RAYS[sq]
+    for dir_idx in dir_idxs:
+        for target in rays[dir_idx]:
+            bit = 1 << target
+            attacks |= bit
+            if occ & bit:       # blocked, the blocker itself can still be hit
+                break
+    return attacks
+
+
+def _blocker_mask(sq, dir_idxs):
+    """
+    Returns the cells on the rays of the given square that can block a sliding piece (the last cell of a ray can't).
+    """
+    mask = 0
+    rays = RAYS[sq]
+    for dir_idx in dir_idxs:
+        for target in rays[dir_idx][:-1]:
+            mask |= 1 << target
+    return mask
+
+
+def _build_slider_tables(dir_idxs):
+    masks = []
+    attacks = []
+    for sq in range(64):
+        mask = _blocker_mask(sq, dir_idxs)
+        table = {}
+        blockers = 0
+        while True:     # enumerates all subsets of the mask (carry-rippler)
+            table[blockers] = _slide_attacks(sq, blockers, dir_idxs)
+            blockers = (blockers - mask) & mask
+            if blockers == 0:
+                break
+        masks.append(mask)
+        attacks.append(table)
+    return masks, attacks
+
+
+ROOK_MASK, ROOK_ATTACKS = _build_slider_tables(ROOK_RAYS)
+BISHOP_MASK, BISHOP_ATTACKS = _build_slider_tables(BISHOP_RAYS)
+
+
+# Knights and kings don't slide, so their targets only depend on the square they are placed on
+
+KNIGHT_OFFSETS = ((-2, 1), (-2, -1), (2, 1), (2, -1), (1, -2), (-1, -2), (1, 2), (-1, 2))
+KING_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
+def _build_step_table(offsets):
+    table = []
+    for sq in range(64):
+        row, col = divmod(sq, 8)
+        attacks = 0
+        for dr, dc in offsets:
+            r, c = row + dr, col + dc
+            if 0 <= r < 8 and 0 <= c < 8:   # targets outside of the board are clipped
+                attacks |= 1 << (r * 8 + c)
+        table.append(attacks)
+    return table
+
+
+KNIGHT_ATTACKS = _build_step_table(KNIGHT_OFFSETS)
+KING_ATTACKS = _build_step_table(KING_OFFSETS)
+
+# Cells a pawn attacks (diagonally forward), indexed by its color: PAWN_ATTACKS[white][sq]
+PAWN_ATTACKS = (_build_step_table(((-1, -1), (-1, 1))), _build_step_table(((1, -1), (1, 1))))
+
+# Cell a pawn moves to with a single step and with a dash from its starting row, indexed like PAWN_ATTACKS
+PAWN_PUSHES = (_build_step_table(((-1, 0),)), _build_step_table(((1, 0),)))
+PAWN_DASHES = (
+    [attacks if sq // 8 == 6 else 0 for sq, attacks in enumerate(_build_step_table(((-2, 0),)))],
+    [attacks if sq // 8 == 1 else 0 for sq, attacks in enumerate(_build_step_table(((2, 0),)))],
+)
+
+# The same tables for a single color, used by the specialized pawn generators
+BLACK_PAWN_PUSHES, WHITE_PAWN_PUSHES = PAWN_PUSHES
+BLACK_PAWN_DASHES, WHITE_PAWN_DASHES = PAWN_DASHES
+BLACK_PAWN_ATTACKS, WHITE_PAWN_ATTACKS = PAWN_ATTACKS
+
+
+def _build_between_table():
+    """
+    BETWEEN[a][b] contains the cells strictly between a and b if both are on a common line or diagonal, 0 otherwise.
+    """
+    between = [[0] * 64 for _ in range(64)]
+    for sq in range(64):
+        for ray in RAYS[sq]:
+            passed = 0
+            for target in ray:
+                between[sq][target] = passed
+                passed |= 1 << target
+    return between
+
+
+BETWEEN = _build_between_table()
+
+ALL_CELLS = (1 << 64) - 1
+
+# (row, col) cell of every square, so converting squares back to cells reuses these tuples instead of building new ones
+SQUARE_TO_CELL = tuple((sq >> 3, sq & 7) for sq in range(64))
+
+
+def bitboard_to_squares(bitboard):
+    """
+    Turns a bitboard into a list of squares (row * 8 + col), in ascending order.
+    """
+    squares = []
+    while bitboard:
+        squares.append((bitboard & -bitboard).bit_length() - 1)     # index of the lowest set bit
+        bitboard &= bitboard - 1                                    # clear the lowest set bit
+    return squares
+
+
+def bitboard_to_cells(bitboard):
+    """
+    Turns a bitboard into a list of (row, col) cells, ordered by square.
+    """
+    return [SQUARE_TO_CELL[sq] for sq in bitboard_to_squares(bitboard)]
+
+
+# ---------------------------------------------------------------------------
+# Move generators
+#
+# One function per piece type, returning the bitboard of cells a piece of the given color on square sq could move into.
+# Whether the own king would be in check afterwards is not considered here.
+# MOVEGEN[white] maps the PIECE_CODE of a piece to its generator. Pawns get one generator per color, so the direction
+# they move in is fixed in the code instead of being decided on every call.
+# ---------------------------------------------------------------------------
+
+def white_pawn_moves(board, sq, white=True):
+    """
+    Movability of `pawns <https://de.wikipedia.org/wiki/Bauer_(Schach)>`_: one cell forward if that cell is empty,
+    two cells from the starting row if both cells are empty, and hitting opposing pieces diagonally forward.
+    Hitting en passant is not implemented.
+
+    White pawns move towards higher rows, so a cell forward is 8 squares up.
+    """
+    empty = ALL_CELLS ^ board.all_occ
+    pushes = WHITE_PAWN_PUSHES[sq] & empty
+    pushes |= WHITE_PAWN_DASHES[sq] & empty & (pushes << 8)     # the dash needs the cell in between to be empty as well
+    return pushes | (WHITE_PAWN_ATTACKS[sq] & board.black_occ)
+
+
+def black_pawn_moves(board, sq, white=False):
+    """
+    Same as :py:func:`white_pawn_moves` for black pawns, which move towards lower rows (8 squares down).
+    """
+    empty = ALL_CELLS ^ board.all_occ
+    pushes = BLACK_PAWN_PUSHES[sq] & empty
+    pushes |= BLACK_PAWN_DASHES[sq] & empty & (pushes >> 8)     # the dash needs the cell in between to be empty as well
+    return pushes | (BLACK_PAWN_ATTACKS[sq] & board.white_occ)
+
+
+def knight_moves(board, sq, white):
+    """
+    Movability of `knights <https://de.wikipedia.org/wiki/Springer_(Schach)>`_: an "L"-shape of two cells vertically/horizontally
+    and one cell horizontally/vertically. Knights jump over other pieces.
+    """
+    return KNIGHT_ATTACKS[sq] & ~(board.white_occ if white else board.black_occ)
+
+
+def _slider_moves(board, sq, white, masks, attacks):
+    """
+    Shared by all sliding pieces: looks up the attacked cells for the current blockers and drops the cells with own pieces.
+    """
+    return attacks[sq][board.all_occ & masks[sq]] & ~(board.white_occ if white else board.black_occ)
+
+
+def bishop_moves(board, sq, white):
+    """
+    Movability of `bishops <https://de.wikipedia.org/wiki/L%C3%A4ufer_(Schach)>`_: diagonally an arbitrary amount of cells until blocked.
+    """
+    return _slider_moves(board, sq, white, BISHOP_MASK, BISHOP_ATTACKS)
+
+
+def rook_moves(board, sq, white):
+    """
+    Movability of `rooks <https://de.wikipedia.org/wiki/Turm_(Schach)>`_: horizontally or vertically an arbitrary amount of cells until blocked.
+    """
+    return _slider_moves(board, sq, white, ROOK_MASK, ROOK_ATTACKS)
+
+
+def queen_moves(board, sq, white):
+    """
+    Movability of the `queen <https://de.wikipedia.org/wiki/Dame_(Schach)>`_: combines the movability of rooks and bishops.
+    """
+    occ = board.all_occ
+    attacks = ROOK_ATTACKS[sq][occ & ROOK_MASK[sq]] | BISHOP_ATTACKS[sq][occ & BISHOP_MASK[sq]]
+    return attacks & ~(board.white_occ if white else board.black_occ)
+
+
+def king_moves(board, sq, white):
+    """
+    Movability of the `king <https://de.wikipedia.org/wiki/K%C3%B6nig_(Schach)>`_: one cell in any direction.
+    """
+    return KING_ATTACKS[sq] & ~(board.white_occ if white else board.black_occ)
+
+
+# Points for threatening an opposing piece, indexed by its PIECE_CODE (hitting the king is the equivalent to check,
+# which is favourable because of the king's high base points)
+ENEMY_PTS = [0, 1, 3, 3, 5, 9, 12]
+
+
+def _position_factor(row, col):
+    """
+    How close a cell is to the center, as a factor for the evaluation of a piece placed on it.
+    """
+    distance_to_edge = min(row, 7 - row, col, 7 - col)    # 0 on the border up to 3 in the center
+    return (0.91, 0.94, 0.97, 1)[distance_to_edge]
+
+
+# Position factor of every square, used for all pieces except the king
+POSITION_FACTOR = [_position_factor(sq >> 3, sq & 7) for sq in range(64)]
+
+
+MOVEGEN = (
+    [None, black_pawn_moves, knight_moves, bishop_moves, rook_moves, queen_moves, king_moves],
+    [None, white_pawn_moves, knight_moves, bishop_moves, rook_moves, queen_moves, king_moves],
+)
+
+
 
 class Piece:
     """
@@ -7,6 +275,12 @@ class Piece:
     A piece holds a reference to the board, its color and its currently located cell.
     In this class, you need to implement two methods, the "evaluate()" method and the "get_valid_cells()" method.
     """
+    PIECE_CODE = 0      # code of the piece in the flat board representation (board.squares), set by every subclass
+    BASE_PTS = 0        # points the pure existance of the piece is worth in the evaluation, set by every subclass
+    IS_KING = False     # only set by the King, which is exempt from the position factor
+
+    __slots__ = ("board", "white", "sign", "cell", "sq", "movegen")     # pieces only carry these attributes, no per-instance __dict__
+
     def __init__(self, board, white):
         """
         Constructor for a piece based on provided parameters
@@ -16,7 +290,10 @@ class Piece:
         """
         self.board = board      #reference to the board
         self.white = white      #colour of the piece (True=white, False=black)
+        self.sign = 1 if white else -1  #colour as a sign (+1=white, -1=black), as used for the codes in board.squares
         self.cell = None        #cell/position of the piece; tuple of row and colum
+        self.sq = None          #the same cell as square (row * 8 + col), kept in sync by the board
+        self.movegen = MOVEGEN[white][self.PIECE_CODE]  #move generator for the type and colour of the piece
 
 
 
@@ -48,6 +325,24 @@ class Piece:
         """
         return self.board.piece_can_hit_on_cell(self, cell)
 
+    def get_reachable_cells(self):
+        """
+        Returns a list of **reachable** cells this piece could move into, following the movability of its type
+        (see :py:data:`MOVEGEN`).
+
+        **NOTE**: Here it is not yet considered whether the own King would become checked after a move. This is taken care of by
+        the :py:meth:`get_valid_cells` method.
+
+        :return: A list of reachable (row, col) cells.
+        """
+        return bitboard_to_cells(self.movegen(self.board, self.sq, self.white))
+
+    def get_reachable_squares(self):
+        """
+        Same as :py:meth:`get_reachable_cells`, but returns squares (row * 8 + col) instead of (row, col) tuples.
+        """
+        return bitboard_to_squares(self.movegen(self.board, self.sq, self.white))
+
     def evaluate(self, ai_mode=True):
         """
         **TODO** Implement a meaningful numerical evaluation of this piece on the board.
@@ -62,19 +357,9 @@ class Piece:
         """
         # each piece gets base points assigned, according to its class
         
-        base_pts = 0
-
-        if isinstance(self, Pawn):
-            base_pts = 1
-        elif isinstance(self, Knight) or isinstance(self, Bishop):
-            base_pts = 3
-        elif isinstance(self, Rook):
-            base_pts = 5
-        elif isinstance(self, Queen):
-            base_pts = 9
-        elif isinstance(self, King):
-            base_pts = 999999
-        elif base_pts == 0:         # controll structure;  for the case that the piece is not an object of any our known classes
+        base_pts = self.BASE_PTS    # set by every subclass
+
+        if base_pts == 0:           # controll structure;  for the case that the piece is not an object of any our known classes
             return 0
         
         score = base_pts            # these base points are the foundation of this pieces score
@@ -83,38 +368,20 @@ class Piece:
             
             # Bedrohen von pieces                   # the ability to hit oposing pieces in the next move adds value to the piece;
             offensive_base_factor = 1               # corresponding to the base points of the potentially hitted piece
-            valid_cells = self.get_valid_cells()
-            for cell in valid_cells:                # iterates through all valid cells of the piece
-                enemy_base_pts = 0
-                occupant = self.board.get_cell(cell)
-                if occupant is not None:            # if an opposing piece can be hit in the next move, check the class of the piece
-                    if isinstance(occupant, Pawn):
-                        enemy_base_pts = 1
-                    elif isinstance(occupant, Knight) or isinstance(occupant, Bishop):
-                        enemy_base_pts = 3
-                    elif isinstance(occupant, Rook):
-                        enemy_base_pts = 5
-                    elif isinstance(occupant, Queen):
-                        enemy_base_pts = 9
-                    elif isinstance(occupant, King):    # the equivalent to check (a check is favourable bc of the king's high base points)
-                        enemy_base_pts = 12
+            squares = self.board.squares
+            valid_squares = self.get_valid_squares()
+            for sq in valid_squares:                # iterates through all valid cells of the piece
+                # if an opposing piece can be hit in the next move, its points are looked up by its code (0 for an empty cell)
+                enemy_base_pts = ENEMY_PTS[abs(squares[sq])]
                 score += enemy_base_pts / 10        # adds a tenth of the base points of the hittable piece to the piece
                     
                     
             # position on the board/moveability
 
-            row, col = self.cell        # unpacking of the current position of the piece in row and colum (col)
             position_factor = 1
-            # checks with the row and col, how close the current position of the piece is to the center
-            if not isinstance(self, King):          # for all pieces except the king
-                if (row == 0 or row == 7) or (col == 0 or col == 7):
-                    position_factor = 0.91
-                elif (row == 1 or row == 6) or (col == 1 or col == 6):
-                    position_factor = 0.94
-                elif (row == 2 or row == 5) or (col == 2 or col == 5):
-                    position_factor = 0.97
-                elif (row == 3 or row == 4) and (col == 3 or col == 4):
-                    position_factor = 1
+            # looks up how close the current position of the piece is to the center
+            if not self.IS_KING:                    # for all pieces except the king
+                position_factor = POSITION_FACTOR[self.sq]
             
             score *= position_factor    # the closer to the center; the higher the moveability, the higher the position factor
 
@@ -139,429 +406,86 @@ class Piece:
         Then call :py:meth:`set_cell <board.BoardBase.set_cell>` to place this piece on the target cell and test for any checks given. 
         After this, restore the original configuration by placing this piece back into its old position (call :py:meth:`set_cell <board.BoardBase.set_cell>` again)
         and place the previous piece also back into its cell. 
-        
-        :return: Return True 
-        """
-
-        valid_cells = []                            #creation of a new list which should contain all the valid cells for a piece
-        og_cell = self.cell                         # -> valid cells = possible moves that don't leave or put the own king in a check
-        reachable_cells = self.get_reachable_cells()
-       
-        for cell in reachable_cells:                # iterates through all the reachable cells of the piece
-            enemy = self.board.get_cell(cell)       # sets the new position on the board
-            self.board.set_cell(cell, self)
-
-            if not self.board.is_king_check_cached(self.white): # checks if the own king is in check in the newly set position
-                valid_cells.append(cell)                        # if not, appends the cell to valid_cells
-
-            self.board.set_cell(og_cell, self)      # reapplies the original board configurations
-            self.board.set_cell(cell, enemy)
-
-        return valid_cells                          # returns a list of the valid cells of the piece
-            
-
-class Pawn(Piece):  # Bauer
-    def __init__(self, board, white):
-        super().__init__(board, white)
-
-    def get_reachable_cells(self):
-        """
-        **TODO** Implement the movability mechanik for `pawns <https://de.wikipedia.org/wiki/Bauer_(Schach)>`_. 
-
-        **NOTE**: Here you do not yet need to consider whether your own King would become checked after a move. This will be taken care of by
-        the :py:meth:`is_king_check <board.Board.is_king_check>` and :py:meth:`get_valid_cells <pieces.Piece.get_valid_cells>` methods.
 
-        **HINT**: Pawns can move only forward (towards the opposing army). Depening of whether this piece is black of white, this means pawn
-        can move only to higher or lower rows. Normally a pawn can only move one cell forward as long as the target cell is not occupied by any other piece. 
-        If the pawn is still on its starting row, it can also dash forward and move two pieces at once (as long as the path to that cell is not blocked).
-        Pawns can only hit diagonally, meaning they can hit other pieces only the are one cell forward left or one cell forward right from them. 
-
-        You can call :py:meth:`cell_is_valid_and_empty <board.Board.cell_is_valid_and_empty>`, 
-        :py:meth:`can_hit_on_cell <pieces.Piece.can_hit_on_cell>` and :py:meth:`can_enter_cell <pieces.Piece.can_enter_cell>` 
-        to check for necessary conditions to implement the pawn movability mechanics. 
-
-        **NOTE**: For all you deep chess experts: Hitting `en passant <https://de.wikipedia.org/wiki/En_passant>`_ does not need to be implemented.
+        **NOTE**: Instead of trying every move, the check and pin masks from :py:meth:`compute_pins_and_checks <board.Board.compute_pins_and_checks>`
+        are computed once and every reachable cell is tested against them.
         
-        :return: A list of reachable cells this pawn could move into.
+        :return: Return True 
         """
-        reachable_cells = []        # creation of a list that should contain all the cells the pawn can reach in its next move;
-        row, col = self.cell        # following the rules and in consideration of the current board configuration
-
-        if self.white == True:      # white pawns
-            if self.board.cell_is_valid_and_empty((row+1, col)):                # can always move one cell 'up' the board;
-                reachable_cells.append((row+1, col))                            # if this cell is valid and empty
-                if row == 1 and self.board.cell_is_valid_and_empty((3, col)):   # can move two cells 'up' the board on its first move;
-                    reachable_cells.append((3, col))                            # if both of these cells are valid and empty
-            if self.can_hit_on_cell((row+1, col+1)):                       
-                reachable_cells.append((row+1, col+1))       # can hit one cell diagonally 'up' the board 
-            if self.can_hit_on_cell((row+1, col-1)):         # if this cell has a piece of the opposing colour (black) on it
-                reachable_cells.append((row+1, col-1))
-
-        if self.white == False:     # black pawns
-            if self.board.cell_is_valid_and_empty((row-1, col)):                # can always move one cell 'down' the board;
-                reachable_cells.append((row-1, col))                            # if this cell is valid and empty
-                if row == 6 and self.board.cell_is_valid_and_empty((4, col)):   # can move two cells 'down' the board on its first move;
-                    reachable_cells.append((4, col))                            # if both of these cells are valid and empty
-            if self.can_hit_on_cell((row-1, col+1)):
-                reachable_cells.append((row-1, col+1))      # can hit one cell diagonally 'down' the board
-            if self.can_hit_on_cell((row-1, col-1)):        # if this cell has a piece of the opposing colour (white) on it
-                reachable_cells.append((row-1, col-1))
-
-        return reachable_cells      # returns the list of reachable cells
-
-
-class Rook(Piece):  # Turm
-    def __init__(self, board, white):
-        super().__init__(board, white)
+        return [SQUARE_TO_CELL[sq] for sq in self.get_valid_squares()]
 
-    def get_reachable_cells(self):
+    def get_valid_squares(self):
         """
-        **TODO** Implement the movability mechanic for `rooks <https://de.wikipedia.org/wiki/Turm_(Schach)>`_. 
-
-        **NOTE**: Here you do not yet need to consider whether your own King would become checked after a move. This will be taken care of by
-        the :py:meth:`is_king_check <board.Board.is_king_check>` and :py:meth:`get_valid_cells <pieces.Piece.get_valid_cells>` methods.
-
-        **HINT**: Rooks can move only horizontally or vertically. They can move an arbitrary amount of cells until blocked by an own piece
-        or an opposing piece (which they could hit and then being stopped).
-
-        You can call :py:meth:`cell_is_valid_and_empty <board.Board.cell_is_valid_and_empty>`, 
-        :py:meth:`can_hit_on_cell <pieces.Piece.can_hit_on_cell>` and :py:meth:`can_enter_cell <pieces.Piece.can_enter_cell>` 
-        to check for necessary conditions to implement the rook movability mechanics. 
-
-        :return: A list of reachable cells this rook could move into.
+        Same as :py:meth:`get_valid_cells`, but returns squares (row * 8 + col) instead of (row, col) tuples.
         """
-        reachable_cells = []        # creation of a list that should contain all the cells the rook can reach in its next move
-        row, col = self.cell        # unpacking of the current position of the rook in row and colum (col)
+        board = self.board
+        sq = self.sq
+        moves = self.movegen(board, sq, self.white)
 
-        # the rook moves vertically or horizontally
+        if self.IS_KING:
+            # the king must not move onto an attacked cell; it is taken off the board so it can't hide behind itself.
+            # Only its few target cells are tested, with the same attacker lookup that detects a check
+            occ = board.all_occ & ~(1 << sq)
+            return [target for target in bitboard_to_squares(moves) if not board.attackers_of(target, not self.white, occ)]
 
-       #vertikale Bewegung
+        # any other piece has to resolve a check and must not leave the line it is pinned on
+        check_mask, pin_ray = board.compute_pins_and_checks_cached(self.white)
 
-        for r in range(row+1, 8):           # iteration vertically 'up' the board
-        
-            if self.board.cell_is_valid_and_empty((r, col)):    # check if the cell is valid and empty
-                reachable_cells.append((r, col))                # if v and e; append cell and continue iteration
-            elif self.can_hit_on_cell((r, col)):                # if not v and e; check if the rook can hit on this cell an opponent
-                reachable_cells.append((r, col))
-                break                                           # if rook can hit; append the cell and break
-            else:                                               # if not v and e + rook can't hit; break
-                break
-                
-        for r in reversed(range(0, row)):   # iteration vertically 'down' the board
-        
-            if self.board.cell_is_valid_and_empty((r, col)):
-                reachable_cells.append((r, col))
-            elif self.can_hit_on_cell((r, col)):
-                reachable_cells.append((r, col))
-                break
-            else:
-                break
+        # valid squares = possible moves that don't leave or put the own king in a check, all tested with a single AND
+        return bitboard_to_squares(moves & check_mask & pin_ray[sq])
 
-        #horizontale Bewegung
 
-        for c in reversed(range(0, col)):   # iteration horizontally to the 'left' on the board
-        
-            if self.board.cell_is_valid_and_empty((row, c)):
-                reachable_cells.append((row, c))
-            elif self.can_hit_on_cell((row, c)):
-                reachable_cells.append((row, c))
-                break
-            else:
-                break
-        
-        for c in range(col+1, 8):           # iteration horizontally to the 'right' on the board
-        
-            if self.board.cell_is_valid_and_empty((row, c)):
-                reachable_cells.append((row, c))
-            elif self.can_hit_on_cell((row, c)):
-                reachable_cells.append((row, c))
-                break
-            else:
-                break
-                
-        return reachable_cells              # returns the list of reachable cells
 
+class Pawn(Piece):  # Bauer
+    PIECE_CODE = 1
+    BASE_PTS = 1
+    __slots__ = ()
 
-class Knight(Piece):  # Springer
     def __init__(self, board, white):
         super().__init__(board, white)
 
-    def get_reachable_cells(self):
-        """
-        **TODO** Implement the movability mechanic for `knights <https://de.wikipedia.org/wiki/Springer_(Schach)>`_. 
-
-        **NOTE**: Here you do not yet need to consider whether your own King would become checked after a move. This will be taken care of by
-        the :py:meth:`is_king_check <board.Board.is_king_check>` and :py:meth:`get_valid_cells <pieces.Piece.get_valid_cells>` methods.
-
-        **HINT**: Knights can move in a special pattern. They can move two rows up or down and then one column left or right. Alternatively, they can
-        move one row up or down and then two columns left or right. They are not blocked by pieces in between. 
-
-        You can call :py:meth:`cell_is_valid_and_empty <board.Board.cell_is_valid_and_empty>`, 
-        :py:meth:`can_hit_on_cell <pieces.Piece.can_hit_on_cell>` and :py:meth:`can_enter_cell <pieces.Piece.can_enter_cell>` 
-        to check for necessary conditions to implement the rook movability mechanics. 
-
-        :return: A list of reachable cells this knight could move into.
-        """
-        reachable_cells = []                # creation of a list that should contain all the cells the knight can reach in its next move
-        row, col = self.cell                # unpacking of the current position of the knight in row and colum (col)
-
-        # Movement pattern of the knight is an "L"-Shape (two cells vertically/horizontally and one cell horizontally/vertically)
-
-        # 'bw' Bewegung
-        if self.can_enter_cell((row-2, col+1)):         # checks if the knight can enter the cell 'down' the board to the 'right' 
-            reachable_cells.append((row-2, col+1))      # can enter cell = valid cell, which is empty or contains an opposing piece
-
-        if self.can_enter_cell((row-2, col-1)):         # checks if the knight can enter the cell 'down' the board to the 'left'
-            reachable_cells.append((row-2, col-1))
-
-        # 'fw' Bewegung                                 # checks if the knight can enter the cells 'up' the board, to the 'right' or 'left'
-        if self.can_enter_cell((row+2, col+1)):
-            reachable_cells.append((row+2, col+1))
-
-        if self.can_enter_cell((row+2, col-1)):
-            reachable_cells.append((row+2, col-1))
-
-        # 'li' Bewegung                                 # checks if the knight can enter the cells to the 'left', 'up' or 'down' the board
-        if self.can_enter_cell((row+1, col-2)):
-            reachable_cells.append((row+1, col-2))
-
-        if self.can_enter_cell((row-1, col-2)):
-            reachable_cells.append((row-1, col-2))
-
-        # 'rt' Bewegung                                 # checks if the knight can enter the cells to the 'right', 'up' or 'down' the board
-        if self.can_enter_cell((row+1, col+2)):
-            reachable_cells.append((row+1, col+2))
-
-        if self.can_enter_cell((row-1, col+2)):
-            reachable_cells.append((row-1, col+2))
-
-        return reachable_cells              # returns the list of reachable cells
 
+class Rook(Piece):  # Turm
+    PIECE_CODE = 4
+    BASE_PTS = 5
+    __slots__ = ()
 
-class Bishop(Piece):  # Läufer
     def __init__(self, board, white):
         super().__init__(board, white)
 
-    def get_reachable_cells(self):
-        """
-        **TODO** Implement the movability mechanic for `bishop <https://de.wikipedia.org/wiki/L%C3%A4ufer_(Schach)>`_. 
-
-        **NOTE**: Here you do not yet need to consider whether your own King would become checked after a move. This will be taken care of by
-        the :py:meth:`is_king_check <board.Board.is_king_check>` and :py:meth:`get_valid_cells <pieces.Piece.get_valid_cells>` methods.
-
-        **HINT**: Bishops can move diagonally an arbitrary amount of cells until blocked.
-
-        You can call :py:meth:`cell_is_valid_and_empty <board.Board.cell_is_valid_and_empty>`, 
-        :py:meth:`can_hit_on_cell <pieces.Piece.can_hit_on_cell>` and :py:meth:`can_enter_cell <pieces.Piece.can_enter_cell>` 
-        to check for necessary conditions to implement the rook movability mechanics. 
-
-        :return: A list of reachable cells this bishop could move into.
-        """
-        reachable_cells = []            # creation of a list that should contain all the cells the bishop can reach in its next move
-        row, col = self.cell            # unpacking of the current position of the bishop in row and colum (col)
-
-        # the bishop can move diagonally
-
-        # 'fw-rt' Bewegung                                              # movement diagonally 'up' the board and to the 'right'
-        cols = col
-        for diagonal_r in range(row+1, 8):                              # iteration 'up' the board (row+1)
-            cols = cols + 1                                             # each iteration step also one cell to the 'right' (cols+1)
-            if self.board.cell_is_valid_and_empty((diagonal_r, cols)):  # check if the cell is valid and empty
-                reachable_cells.append((diagonal_r, cols))              # if v and e; append cell and continue iteration
-            elif self.can_hit_on_cell((diagonal_r, cols)):              # if not v and e; check if the bishop can hit on this cell an opponent
-                reachable_cells.append((diagonal_r, cols))
-                break                                                   # if bishop can hit; append the cell and break
-            else:                                                       # if not v and e + bishop can't hit; break
-                break
-
-        # 'bw-rt' Bewegung                                              # movement diagonally 'down' the board and to the 'right'
-        cols = col
-        for diagonal_r in reversed(range(0, row)):                      # iteration 'down' the board (row-1)
-            cols = cols + 1                                             # each iteration step also one cell to the 'right' (cols+1)
-            if self.board.cell_is_valid_and_empty((diagonal_r, cols)):
-                reachable_cells.append((diagonal_r, cols))
-            elif self.can_hit_on_cell((diagonal_r, cols)):
-                reachable_cells.append((diagonal_r, cols))
-                break
-            else:
-                break
-
-        # 'fw-li' Bewegung                                              # movement diagonally 'up' the board and to the 'left'
-        cols = col
-        for diagonal_r in range(row+1, 8):                              # iteration 'up' the board (row+1)
-            cols = cols - 1                                             # each iteration step also one cell to the 'left' (cols-1)
-            if self.board.cell_is_valid_and_empty((diagonal_r, cols)):
-                reachable_cells.append((diagonal_r, cols))
-            elif self.can_hit_on_cell((diagonal_r, cols)):
-                reachable_cells.append((diagonal_r, cols))
-                break
-            else:
-                break
-
-        # 'bw-li' Bewegung                                              # movement diagonally 'down' the board and to the 'left'
-        cols = col
-        for diagonal_r in reversed(range(0, row)):                      # iteration 'down' the board (row-1)
-            cols = cols - 1                                             # each iteration step also one cell to the 'left' (cols-1)
-            if self.board.cell_is_valid_and_empty((diagonal_r, cols)):
-                reachable_cells.append((diagonal_r, cols))
-            elif self.can_hit_on_cell((diagonal_r, cols)):
-                reachable_cells.append((diagonal_r, cols))
-                break
-            else:
-                break
-                
-        return reachable_cells              # returns the list of reachable cells
 
+class Knight(Piece):  # Springer
+    PIECE_CODE = 2
+    BASE_PTS = 3
+    __slots__ = ()
 
-class Queen(Piece):  # Königin
     def __init__(self, board, white):
         super().__init__(board, white)
 
-    def get_reachable_cells(self):
-        """
-        **TODO** Implement the movability mechanic for the `queen <https://de.wikipedia.org/wiki/Dame_(Schach)>`_. 
-
-        **NOTE**: Here you do not yet need to consider whether your own King would become checked after a move. This will be taken care of by
-        the :py:meth:`is_king_check <board.Board.is_king_check>` and :py:meth:`get_valid_cells <pieces.Piece.get_valid_cells>` methods.
-
-        **HINT**: Queens can move horizontally, vertically and diagonally an arbitrary amount of cells until blocked. They combine the movability
-        of rooks and bishops. 
-
-        You can call :py:meth:`cell_is_valid_and_empty <board.Board.cell_is_valid_and_empty>`, 
-        :py:meth:`can_hit_on_cell <pieces.Piece.can_hit_on_cell>` and :py:meth:`can_enter_cell <pieces.Piece.can_enter_cell>` 
-        to check for necessary conditions to implement the rook movability mechanics. 
-
-        :return: A list of reachable cells this queen could move into.
-        """
-        reachable_cells = []            # creation of a list that should contain all the cells the queen can reach in its next move
-        row, col = self.cell            # unpacking of the current position of the queen in row and colum (col)
-
-        # the queen can move horizontally, vertically or diagonally
-
-        #vertikale Bewegung
-
-        for r in range(row+1, 8):           # iteration vertically 'up' the board
-        
-            if self.board.cell_is_valid_and_empty((r, col)):
-                reachable_cells.append((r, col))
-            elif self.can_hit_on_cell((r, col)):
-                reachable_cells.append((r, col))
-                break
-            else:
-                break
-                
-        for r in reversed(range(0, row)):   # iteration vertically 'down' the board
-        
-            if self.board.cell_is_valid_and_empty((r, col)):
-                reachable_cells.append((r, col))
-            elif self.can_hit_on_cell((r, col)):
-                reachable_cells.append((r, col))
-                break
-            else:
-                break
-
-        #horizontale Bewegung
-
-        for c in reversed(range(0, col)):   # iteration horizontally to the 'left'
-        
-            if self.board.cell_is_valid_and_empty((row, c)):
-                reachable_cells.append((row, c))
-            elif self.can_hit_on_cell((row, c)):
-                reachable_cells.append((row, c))
-                break
-            else:
-                break
-        
-        for c in range(col+1, 8):           # iteration horizontally to the 'right'
-        
-            if self.board.cell_is_valid_and_empty((row, c)):
-                reachable_cells.append((row, c))
-            elif self.can_hit_on_cell((row, c)):
-                reachable_cells.append((row, c))
-                break
-            else:
-                break
-                
-        # 'fw-rt' Bewegung                  # movement diagonally 'up' the board and to the 'right'
-        cols = col
-        for diagonal_r in range(row+1, 8):
-            cols = cols + 1
-            if self.board.cell_is_valid_and_empty((diagonal_r, cols)):
-                reachable_cells.append((diagonal_r, cols))
-            elif self.can_hit_on_cell((diagonal_r, cols)):
-                reachable_cells.append((diagonal_r, cols))
-                break
-            else:
-                break
-
-        # 'bw-rt' Bewegung                  # movement diagonally 'down' the board and to the 'right'
-        cols = col
-        for diagonal_r in reversed(range(0, row)):
-            cols = cols + 1
-            if self.board.cell_is_valid_and_empty((diagonal_r, cols)):
-                reachable_cells.append((diagonal_r, cols))
-            elif self.can_hit_on_cell((diagonal_r, cols)):
-                reachable_cells.append((diagonal_r, cols))
-                break
-            else:
-                break
-
-        # 'fw-li' Bewegung                  # movement diagonally 'up' the board and to the 'left'
-        cols = col
-        for diagonal_r in range(row+1, 8):
-            cols = cols - 1
-            if self.board.cell_is_valid_and_empty((diagonal_r, cols)):
-                reachable_cells.append((diagonal_r, cols))
-            elif self.can_hit_on_cell((diagonal_r, cols)):
-                reachable_cells.append((diagonal_r, cols))
-                break
-            else:
-                break
-
-        # 'bw-li' Bewegung                  # movement diagonally 'down' the board and to the 'left'
-        cols = col
-        for diagonal_r in reversed(range(0, row)):
-            cols = cols - 1
-            if self.board.cell_is_valid_and_empty((diagonal_r, cols)):
-                reachable_cells.append((diagonal_r, cols))
-            elif self.can_hit_on_cell((diagonal_r, cols)):
-                reachable_cells.append((diagonal_r, cols))
-                break
-            else:
-                break
-
-        return reachable_cells          # returns the list of reachable cells
 
+class Bishop(Piece):  # Läufer
+    PIECE_CODE = 3
+    BASE_PTS = 3
+    __slots__ = ()
 
-class King(Piece):  # König
     def __init__(self, board, white):
         super().__init__(board, white)
 
-    def get_reachable_cells(self):
-        """
-        **TODO** Implement the movability mechanic for the `king <https://de.wikipedia.org/wiki/K%C3%B6nig_(Schach)>`_. 
-
-        **NOTE**: Here you do not yet need to consider whether your own King would become checked after a move. This will be taken care of by
-        the :py:meth:`is_king_check <board.Board.is_king_check>` and :py:meth:`get_valid_cells <pieces.Piece.get_valid_cells>` methods.
-
-        **HINT**: Kings can move horizontally, vertically and diagonally but only one piece at a time.
 
-        You can call :py:meth:`cell_is_valid_and_empty <board.Board.cell_is_valid_and_empty>`, 
-        :py:meth:`can_hit_on_cell <pieces.Piece.can_hit_on_cell>` and :py:meth:`can_enter_cell <pieces.Piece.can_enter_cell>` 
-        to check for necessary conditions to implement the rook movability mechanics. 
+class Queen(Piece):  # Königin
+    PIECE_CODE = 5
+    BASE_PTS = 9
+    __slots__ = ()
 
-        :return: A list of reachable cells this king could move into.
-        """
-        reachable_cells = []            # creation of a list that should contain all the cells the king can reach in its next move
-        row, col = self.cell            # unpacking of the current position of the king in row and colum (col)
+    def __init__(self, board, white):
+        super().__init__(board, white)
 
-        # the king can move one cell in any direction (horizontally, vertically, diagonally)
 
-        for i_r in range(-1,2):                                 # iteration over [-1, 0, 1] = summand to the row
-            for i_c in range(-1,2):                             # iteration over [-1, 0, 1] = summand to the colum
-                if i_r == 0 and i_c == 0:                       # if both summands are 0 -> continue iteration; (bc (row+0, col+0) == current position)
-                    continue
-                if self.can_enter_cell((row+i_r, col+i_c)):     # checks if the king can enter the cell
-                    reachable_cells.append((row+i_r, col+i_c))  # can enter cell = valid cell, which is empty or contains an opposing piece
+class King(Piece):  # König
+    PIECE_CODE = 6
+    BASE_PTS = 999999
+    IS_KING = True
+    __slots__ = ()
 
-        return reachable_cells          # returns the list of reachable cells
+    def __init__(self, board, white):
+        super().__init__(board, white)
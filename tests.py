@@ -20,6 +20,10 @@ def iterate_pieces(board):
       yield piece
 
 
+def valid_cell_names(piece):
+  return { cell_to_string(cell) for cell in piece.get_valid_cells() }
+
+
 def print_movability_error(board, piece, cell, positiveMovement):
   RED = '\x1b[31m'
   GREEN = '\x1b[32m'
@@ -385,6 +389,157 @@ class TestBoard(unittest.TestCase):
       # Now make sure the board configuration did not change
       self.assertEqual(beforeHash, self.board.hash(), "piece.get_valid_cells must not alter board configuration after its return")
 
+  @colorize(color=RED)
+  def test_B08_make_unmake_leaves_board_intact(self):
+    # Load a configuration from disk
+    self.board.load_from_disk("tests/random1.board")
+
+    # Hash it for later reference
+    beforeHash = self.board.hash()
+    beforeZobrist = self.board.zobrist
+
+    # Make and take back every valid move of every piece
+    for piece in list(iterate_pieces(self.board)):
+      for cell in piece.get_valid_cells():
+        origin = piece.cell
+        target = self.board.get_cell(cell)
+
+        self.board.make(origin, cell)
+        self.assertEqual(self.board.get_cell(cell), piece, "board.make must move the piece onto the target cell")
+        self.assertIsNone(self.board.get_cell(origin), "board.make must leave the origin cell empty")
+
+        self.board.unmake()
+        self.assertEqual(self.board.get_cell(origin), piece, "board.unmake must put the piece back onto its origin cell")
+        self.assertEqual(self.board.get_cell(cell), target, "board.unmake must restore a hit piece")
+
+        # Squares (row * 8 + col) are accepted as well
+        self.board.make(origin[0] * 8 + origin[1], cell[0] * 8 + cell[1])
+        self.assertEqual(self.board.get_cell(cell), piece, "board.make must accept squares")
+        self.board.unmake()
+        self.assertEqual(self.board.get_cell(origin), piece, "board.unmake must take back a move made with squares")
+
+    # Now make sure the board configuration did not change
+    self.assertEqual(beforeHash, self.board.hash(), "board.unmake must restore the board configuration")
+    self.assertEqual(beforeZobrist, self.board.zobrist, "board.unmake must restore the zobrist hash")
+
+  @colorize(color=RED)
+  def test_B09_valid_cells_respect_checks_and_pins(self):
+    # (a) A rook pinned by a rook may only move along the pinning line, including hitting the pinning rook
+    self.board.load_from_memory(
+      """. . . . r . . k
+         . . . . . . . .
+         . . . . . . . .
+         . . . . . . . .
+         . . . . . . . .
+         . . . . . . . .
+         . . . . R . . .
+         . . . . K . . .""")
+
+    rook = self.board.get_cell((1, 4))
+    self.assertEqual(valid_cell_names(rook), {"e3", "e4", "e5", "e6", "e7", "e8"}, "A pinned rook must only move along the pinning line!")
+
+    # Once the pinning rook moves away the pin is gone, taking the move back restores it
+    self.board.make((7, 4), (7, 0))
+    self.assertEqual(valid_cell_names(rook), {"a2", "b2", "c2", "d2", "f2", "g2", "h2", "e3", "e4", "e5", "e6", "e7", "e8"}, "A rook that is no longer pinned must move freely!")
+    self.board.unmake()
+    self.assertEqual(valid_cell_names(rook), {"e3", "e4", "e5", "e6", "e7", "e8"}, "Taking back a move must restore the pin!")
+
+    # (b) A bishop pinned on a file can't move at all
+    self.board.load_from_memory(
+      """. . . . r . . k
+         . . . . . . . .
+         . . . . . . . .
+         . . . . . . . .
+         . . . . . . . .
+         . . . . . . . .
+         . . . . B . . .
+         . . . . K . . .""")
+
+    bishop = self.board.get_cell((1, 4))
+    self.assertEqual(valid_cell_names(bishop), set(), "A bishop pinned on a file must not have any valid cells!")
+
+    # (c) Against a check by a single slider, pieces may only hit the checking piece or block the line in between
+    self.board.load_from_memory(
+      """. . . . r . . k
+         . . . . . . . .
+         . . N . . . . .
+         R . . . . . . B
+         . . . . . . . .
+         . . . . . . . .
+         . . . . . . . .
+         . . . . K . . .""")
+
+    self.assertEqual(valid_cell_names(self.board.get_cell((4, 0))), {"e5"}, "A rook must block the check!")
+    self.assertEqual(valid_cell_names(self.board.get_cell((5, 2))), {"e5", "e7"}, "A knight must block the check!")
+    self.assertEqual(valid_cell_names(self.board.get_cell((4, 7))), {"e2", "e8"}, "A bishop must block the check or hit the checking rook!")
+
+    # (d) Against a double check only the king can move
+    self.board.load_from_memory(
+      """. . . . r . . k
+         . . . . . . . .
+         . . . . . . . .
+         R . . . . . . .
+         . . . . . . . .
+         . . . n . . . .
+         . . . . . . . .
+         . . . . K . . .""")
+
+    self.assertEqual(valid_cell_names(self.board.get_cell((4, 0))), set(), "No piece but the king may move in a double check!")
+    self.assertEqual(valid_cell_names(self.board.find_king(True)), {"d1", "d2", "f1"}, "The king must escape a double check!")
+
+    # (e) A pinned piece can't hit a different piece giving check
+    self.board.load_from_memory(
+      """. . . . r . . k
+         . . . . . . . .
+         . . . . . . . .
+         . . . . . . . .
+         . . . . . . . .
+         . . . n . . . .
+         . . . . B . . .
+         . . . . K . . .""")
+
+    bishop = self.board.get_cell((1, 4))
+    self.assertEqual(valid_cell_names(bishop), set(), "A pinned bishop must not hit a knight giving check!")
+
+    # The king can't step back along the line of a checking rook
+    self.board.load_from_memory(
+      """k . . . r . . .
+         . . . . . . . .
+         . . . . . . . .
+         . . . . . . . .
+         . . . . K . . .
+         . . . . . . . .
+         . . . . . . . .
+         . . . . . . . .""")
+
+    self.assertEqual(valid_cell_names(self.board.find_king(True)), {"d3", "d4", "d5", "f3", "f4", "f5"}, "The king must not move along the line of a checking rook!")
+
+    # The king can't hit a defended piece, the piece itself must not hide its defender
+    self.board.load_from_memory(
+      """. . . . r . . k
+         . . . . . . . .
+         . . . . . . . .
+         . . . . . . . .
+         . . . . . . . .
+         . . . . . . . .
+         . . . . n . . .
+         . . . . K . . .""")
+
+    self.assertEqual(valid_cell_names(self.board.find_king(True)), {"d1", "d2", "f1", "f2"}, "The king must not hit a defended piece!")
+
+    # The king can't move next to the opposing king
+    self.board.load_from_memory(
+      """. . . . . . . .
+         . . . . . . . .
+         . . . . . . . .
+         . . . . . . . .
+         . . . . . . . .
+         . . . . k . . .
+         . . . . . . . .
+         . . . . K . . .""")
+
+    self.assertEqual(valid_cell_names(self.board.find_king(True)), {"d1", "f1"}, "The king must not move next to the opposing king!")
+
   # ---------------------------------------------------------------------------
   # Phase C – Engine / MinMax-Einbindung
   # ---------------------------------------------------------------------------